@@ -166,9 +166,9 @@ def main():
                                                                      'float32. Valid Inputs - float32, float64, int32, '
                                                                      'int64')
     parser.add_argument('-f', '--output-format', type=str, default='json',
-                        choices=['json', 'md'],
+                        choices=['json', 'md', 'csv'],
                         help='Benchmark result output format. By default, json. '
-                             'Valid Inputs - json, md')
+                             'Valid Inputs - json, md, csv')
 
     parser.add_argument('-o', '--output-file', type=str, default='./mxnet_operator_benchmarks.json',
                         help='Name and path for the '
@@ -16,6 +16,8 @@
 # under the License.
 
 import os
+import io
+import csv
 import json
 from operator import itemgetter
 
@@ -43,8 +45,7 @@ def merge_map_list(map_list):
     final_map = dict()
 
     for current_map in map_list:
-        for key in current_map:
-            final_map[key] =  current_map[key]
+        final_map.update(current_map)
 
     return final_map
 
@@ -54,6 +55,7 @@ def save_to_file(inp_dict, out_filepath, out_format='json', runtime_features=Non
 
     By default, saves the input dictionary as JSON file. Other supported formats include:
     1. md
+    2. csv
 
     Parameters
     ----------
@@ -62,21 +64,26 @@ def save_to_file(inp_dict, out_filepath, out_format='json', runtime_features=Non
     out_filepath: str
         Output file path
     out_format: str, default 'json'
-        Format of the output file. Supported options - 'json', 'md'. Default - json.
+        Format of the output file. Supported options - 'json', 'md', 'csv'. Default - json.
     runtime_features: map
         Dictionary of runtime_features.
 
     """
     if out_format == 'json':
-        # Save as JSON
+        # Save as JSON. Serialize in memory and write once instead of letting
+        # json.dump issue one small write per token.
         with open(out_filepath, "w") as result_file:
-            json.dump(inp_dict, result_file, indent=4, sort_keys=False)
+            result_file.write(json.dumps(inp_dict, indent=4, sort_keys=False))
     elif out_format == 'md':
         # Save as md
         with open(out_filepath, "w") as result_file:
             result_file.write(_prepare_markdown(inp_dict, runtime_features, profiler))
+    elif out_format == 'csv':
+        # Save as csv
+        with open(out_filepath, "w", newline='') as result_file:
+            result_file.write(_prepare_csv(inp_dict))
     else:
-        raise ValueError(f"Invalid output file format provided - '{out_format}'. Supported - json, md")
+        raise ValueError(f"Invalid output file format provided - '{out_format}'. Supported - json, md, csv")
 
 
 def get_json(inp_dict):
@@ -132,6 +139,17 @@ def _prepare_op_benchmark_result(op, op_bench_result, profiler):
     return result
 
 
+def _prepare_csv(results):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(["operator", "metric", "value"])
+    writer.writerows((op, key, value)
+                     for op, op_bench_results in sorted(results.items(), key=itemgetter(0))
+                     for op_bench_result in op_bench_results
+                     for key, value in op_bench_result.items())
+    return buf.getvalue()
+
+
 def _prepare_markdown(results, runtime_features=None, profiler='native'):
     results_markdown = []
     if runtime_features and 'runtime_features' in runtime_features:
@@ -22,6 +22,7 @@ from recommonmark.transform import AutoStructify
 
 # -- mock out modules
 MOCK_MODULES = ['scipy', 'scipy.sparse', 'sklearn']
+autodoc_mock_imports = MOCK_MODULES
 
 # -- General configuration -----------------------------------------------------
 
@@ -66,7 +67,9 @@ import mxnet as mx
 from mxnet import np, npx
 '''
 
-autosummary_generate = True
+# Regenerating autosummary stubs dominates incremental builds; set
+# MXNET_DOCS_FULL=0 to reuse the stubs from a previous build.
+autosummary_generate = os.environ.get('MXNET_DOCS_FULL', '1') == '1'
 numpydoc_show_class_members = False
 
 # Disable SSL verification in link check.
@@ -1213,6 +1213,18 @@ MXNET_DLL int MXAutogradSetIsRecording(int is_recording, int* prev);
  * \return 0 when success, -1 when failure happens
  */
 MXNET_DLL int MXAutogradSetIsTraining(int is_training, int* prev);
+/*!
+ * \brief set whether to record operator for autograd and whether to train in one call
+ * \param is_recording 1 when recording, 0 when not recording, -1 to keep the current status.
+ * \param is_training 1 when training, 0 when testing, -1 to keep the current status.
+ * \param prev_recording returns the previous recording status before this set.
+ * \param prev_training returns the previous training status before this set.
+ * \return 0 when success, -1 when failure happens
+ */
+MXNET_DLL int MXAutogradSetRecordingState(int is_recording,
+                                          int is_training,
+                                          int* prev_recording,
+                                          int* prev_training);
 /*!
  * \brief get whether autograd recording is on
  * \param curr returns the current status.
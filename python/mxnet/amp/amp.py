@@ -218,9 +218,13 @@ def _wrap_module_functions(module, is_numpy_module, target_dtype, get_aliases, g
                     else list_lp16_ops(target_dtype)
     for fun_name in get_aliases(wrap_list):
         fun_name, modules = get_fun_to_wrap(fun_name, module)
+        fp32_param = None
+        if fp32_param_list and fun_name in fp32_param_list:
+            # One entry per positional input: its name if it stays in FP32, '' otherwise
+            fp32_param = [name if name in fp32_param_list[fun_name] else ''
+                          for name in lists.symbol_bf16.BF16_USE_FP32_PARAMS_INPUTS[fun_name]]
         for cur_module in modules:
             f_to_wrap = getattr(cur_module, fun_name)
-            fp32_param = fp32_param_list[fun_name] if (fp32_param_list and fun_name in fp32_param_list) else None
             setattr(cur_module, fun_name, _wrapper(f_to_wrap, target_dtype, fp32_param=fp32_param))
             if not is_numpy_module and cur_module == module:
                 setattr(module.op, fun_name, _wrapper(f_to_wrap, target_dtype, fp32_param=fp32_param))
@@ -529,10 +533,10 @@ def convert_symbol(sym, input_dtypes, param_dtypes, target_dtype, target_dtype_o
     common_ops = set(cond_ops) & set(fp32_ops)
     assert len(common_ops) == 0, "Common ops in fp32_ops and conditional_fp32_ops: {}".format(common_ops)
 
-    combined_ops = set(target_dtype_ops + fp32_ops + list(cond_ops.keys()))
+    combined_ops = set(target_dtype_ops) | set(fp32_ops) | set(cond_ops)
     original_cond_ops = [cond_op[0] for cond_op in list_conditional_fp32_ops(target_dtype)]
-    all_lp16_fp32_ops = set(list_lp16_ops(target_dtype) + list_fp32_ops(target_dtype) +
-                            list_lp16_fp32_ops(target_dtype) + original_cond_ops)
+    all_lp16_fp32_ops = set(list_lp16_ops(target_dtype)) | set(list_fp32_ops(target_dtype)) | \
+                        set(list_lp16_fp32_ops(target_dtype)) | set(original_cond_ops)
 
     illegal_ops = combined_ops - all_lp16_fp32_ops
     assert len(illegal_ops) == 0, f'''Can only choose ops from one of the four lists
@@ -723,46 +727,48 @@ def list_lp16_ops(target_dtype):
     """Get the default list of LP16 ops for AMP
     """
     if target_dtype in ['float16', np.float16]:
-        return lists.symbol_fp16.FP16_FUNCS
+        return sorted(lists.symbol_fp16.FP16_FUNCS)
     else:
         assert get_dtype_name(target_dtype) in bfloat16.names, "not supported type"
-        return lists.symbol_bf16.BF16_FUNCS
+        return sorted(lists.symbol_bf16.BF16_FUNCS)
 
 def list_fp32_ops(target_dtype):
     """Get the default list of FP32 ops for AMP
     """
     if target_dtype in ['float16', np.float16]:
-        return lists.symbol_fp16.FP32_FUNCS
+        return sorted(lists.symbol_fp16.FP32_FUNCS)
     else:
         assert get_dtype_name(target_dtype) in bfloat16.names, "not supported type"
-        return lists.symbol_bf16.FP32_FUNCS
+        return sorted(lists.symbol_bf16.FP32_FUNCS)
 
 def list_lp16_fp32_ops(target_dtype):
     """Get the default list of ops which run in both LP16 and FP32
     """
     if target_dtype in ['float16', np.float16]:
-        return lists.symbol_fp16.FP16_FP32_FUNCS
+        return sorted(lists.symbol_fp16.FP16_FP32_FUNCS)
     else:
         assert get_dtype_name(target_dtype) in bfloat16.names, "not supported type"
-        return lists.symbol_bf16.BF16_FP32_FUNCS
+        return sorted(lists.symbol_bf16.BF16_FP32_FUNCS)
 
 def list_conditional_fp32_ops(target_dtype):
     """Get the conditional fp32 ops list
     """
     if target_dtype in ['float16', np.float16]:
-        return lists.symbol_fp16.CONDITIONAL_FP32_FUNCS
+        cond_ops = lists.symbol_fp16.CONDITIONAL_FP32_FUNCS
     else:
         assert get_dtype_name(target_dtype) in bfloat16.names, "not supported type"
-        return lists.symbol_bf16.CONDITIONAL_FP32_FUNCS
+        cond_ops = lists.symbol_bf16.CONDITIONAL_FP32_FUNCS
+    return [(op_name, attr_name, sorted(attr_vals))
+            for op_name, (attr_name, attr_vals) in sorted(cond_ops.items())]
 
 def list_widest_type_cast(target_dtype):
     """Get the widest type cast ops list
     """
     if target_dtype in ['float16', np.float16]:
-        return lists.symbol_fp16.WIDEST_TYPE_CASTS
+        return sorted(lists.symbol_fp16.WIDEST_TYPE_CASTS)
     else:
         assert get_dtype_name(target_dtype) in bfloat16.names, "not supported type"
-        return lists.symbol_bf16.WIDEST_TYPE_CASTS
+        return sorted(lists.symbol_bf16.WIDEST_TYPE_CASTS)
 
 def list_loss_output_functions(target_dtype):
     """Get loss function list
@@ -18,5 +18,23 @@
 # coding: utf-8
 """Lists of functions whitelisted/blacklisted for automatic mixed precision."""
 
-from . import symbol_fp16
-from . import symbol_bf16
+import importlib
+
+__all__ = ['symbol_fp16', 'symbol_bf16']
+
+
+def _check_disjoint(**tables):
+    """Assert that no op name is listed in more than one of the given tables."""
+    names = list(tables)
+    for i, first in enumerate(names):
+        for second in names[i + 1:]:
+            common = set(tables[first]) & set(tables[second])
+            assert not common, f"Ops {sorted(common)} are listed in both {first} and {second}"
+
+
+def __getattr__(name):
+    # The lists are only imported once AMP asks for the matching target dtype,
+    # so a float16-only program never builds the bfloat16 tables and vice versa.
+    if name in __all__:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -19,28 +19,32 @@
 """Lists of functions whitelisted/blacklisted for automatic mixed precision in symbol API."""
 
 from ...runtime import Features
+from . import _check_disjoint
+
+_ONEDNN = Features.instance.is_enabled('ONEDNN')
 
 # Functions that should be cast to lower precision
-BF16_FUNCS = [
+_BF16_FUNCS_BASE = frozenset([
     'Convolution',
     'Deconvolution',
     'FullyConnected'
-]
-if Features.instance.is_enabled('ONEDNN'):
-    BF16_FUNCS.extend([
-        '_sg_onednn_conv',
-        '_sg_onednn_fully_connected',
-        '_sg_onednn_selfatt_qk',
-        '_sg_onednn_selfatt_qk_split',
-        '_sg_onednn_selfatt_valatt'
-    ])
+])
+_BF16_FUNCS_ONEDNN = frozenset([
+    '_sg_onednn_conv',
+    '_sg_onednn_fully_connected',
+    '_sg_onednn_selfatt_qk',
+    '_sg_onednn_selfatt_qk_split',
+    '_sg_onednn_selfatt_valatt'
+])
+BF16_FUNCS = (_BF16_FUNCS_BASE | _BF16_FUNCS_ONEDNN if _ONEDNN
+              else _BF16_FUNCS_BASE)
 
 
 # Functions that should not be casted, either because
 # they are irrelevant (not used in the network itself
 # like image transformations or optimizers) or they
 # are dtype neutral (can work in both bf16 and fp32)
-BF16_FP32_FUNCS = [
+BF16_FP32_FUNCS = frozenset([
     '_contrib_AdaptiveAvgPooling2D',
     'Activation',
     'BatchNorm',
@@ -78,12 +82,12 @@ BF16_FP32_FUNCS = [
     'Cast',
     'where',
     'take',
-]
+])
 # 'RNN', # GetEnv("MXNET_USE_ONEDNN_RNN", 1)
 
 # Functions with multiple inputs, that need the same
 # type of all their inputs
-WIDEST_TYPE_CASTS = [
+_WIDEST_TYPE_CASTS_BASE = frozenset([
     'Concat',
     'dot',
     'batch_dot',
@@ -98,22 +102,30 @@ WIDEST_TYPE_CASTS = [
     '_npi_multiply',
     '_npi_subtract',
     '_npi_true_divide',
-]
-if Features.instance.is_enabled('ONEDNN'):
-    WIDEST_TYPE_CASTS.extend([
-        '_sg_onednn_batch_dot',
-        '_sg_onednn_batch_norm',
-    ])
+])
+_WIDEST_TYPE_CASTS_ONEDNN = frozenset([
+    '_sg_onednn_batch_dot',
+    '_sg_onednn_batch_norm',
+])
+WIDEST_TYPE_CASTS = (_WIDEST_TYPE_CASTS_BASE | _WIDEST_TYPE_CASTS_ONEDNN if _ONEDNN
+                     else _WIDEST_TYPE_CASTS_BASE)
 
 # Functions that when running with Bfloat16, the params that still need float32.
 BF16_USE_FP32_PARAMS = {
-    'BatchNormWithReLU': ["", "gamma", "beta", "moving_mean", "moving_var"],
-    'BatchNorm': ["", "gamma", "beta", "moving_mean", "moving_var"],
+    'BatchNormWithReLU': frozenset(["gamma", "beta", "moving_mean", "moving_var"]),
+    'BatchNorm': frozenset(["gamma", "beta", "moving_mean", "moving_var"]),
+}
+
+# Inputs of the functions in BF16_USE_FP32_PARAMS in positional order, so that
+# positional arguments can be matched against the params above.
+BF16_USE_FP32_PARAMS_INPUTS = {
+    'BatchNormWithReLU': ("data", "gamma", "beta", "moving_mean", "moving_var"),
+    'BatchNorm': ("data", "gamma", "beta", "moving_mean", "moving_var"),
 }
 
 # Functions that have to be cast to FP32 due to possible
 # overflows
-FP32_FUNCS = [
+FP32_FUNCS = frozenset([
     'amp_cast',
     'amp_multicast',
     'masked_softmax',
@@ -739,14 +751,41 @@ FP32_FUNCS = [
     'topk',
     'trunc',
     'zeros_like',
-]
+])
+
+def _fp32_funcs_with_prefix(*prefixes):
+    return frozenset(name for name in FP32_FUNCS if name.startswith(prefixes))
+
+# FP32_FUNCS partitioned by operator family, for tools that only care about
+# one family; FP32_CORE_FUNCS holds whatever is left
+FP32_NPI_FUNCS = _fp32_funcs_with_prefix('_npi_', '_npx_', '_np_')
+FP32_RANDOM_FUNCS = _fp32_funcs_with_prefix('_random_', '_sample_')
+FP32_IMAGE_FUNCS = _fp32_funcs_with_prefix('_image_', '_cv')
+FP32_LINALG_FUNCS = _fp32_funcs_with_prefix('_linalg_')
+FP32_CONTRIB_FUNCS = _fp32_funcs_with_prefix('_contrib_')
+FP32_CORE_FUNCS = (FP32_FUNCS - FP32_NPI_FUNCS - FP32_RANDOM_FUNCS - FP32_IMAGE_FUNCS -
+                   FP32_LINALG_FUNCS - FP32_CONTRIB_FUNCS)
 
 # Functions that have to be cast to FP32 only for
-# some values of their parameters
-CONDITIONAL_FP32_FUNCS = [
-    ('LeakyReLU', 'act_type', ['selu']),
-]
+# some values of their parameters, as {name: (parameter, values)}
+CONDITIONAL_FP32_FUNCS = {
+    'LeakyReLU': ('act_type', frozenset(['selu'])),
+}
 
 LOSS_OUTPUT_FUNCTIONS = [
     'SoftmaxOutput'
 ]
+
+# Cast policy of every op listed in the tables above
+POLICY_BF16, POLICY_FP32, POLICY_WIDEST, POLICY_BF16_FP32, POLICY_CONDITIONAL_FP32 = range(5)
+
+# Single op name -> cast policy lookup, built once at import
+OP_POLICY = dict.fromkeys(BF16_FUNCS, POLICY_BF16)
+OP_POLICY.update(dict.fromkeys(FP32_FUNCS, POLICY_FP32))
+OP_POLICY.update(dict.fromkeys(WIDEST_TYPE_CASTS, POLICY_WIDEST))
+OP_POLICY.update(dict.fromkeys(BF16_FP32_FUNCS, POLICY_BF16_FP32))
+OP_POLICY.update(dict.fromkeys(CONDITIONAL_FP32_FUNCS, POLICY_CONDITIONAL_FP32))
+if __debug__:
+    _check_disjoint(BF16_FUNCS=BF16_FUNCS, BF16_FP32_FUNCS=BF16_FP32_FUNCS,
+                    FP32_FUNCS=FP32_FUNCS, WIDEST_TYPE_CASTS=WIDEST_TYPE_CASTS,
+                    CONDITIONAL_FP32_FUNCS=CONDITIONAL_FP32_FUNCS)
@@ -19,10 +19,12 @@
 """Lists of functions whitelisted/blacklisted for automatic mixed precision in symbol API."""
 
 from ...runtime import Features
+from . import _check_disjoint
 
+_ONEDNN = Features().is_enabled('ONEDNN')
 
 # Functions that should be cast to lower precision
-FP16_FUNCS = [
+FP16_FUNCS = frozenset([
     '_linalg_gemm',
     '_linalg_gemm2',
     '_npi_einsum',
@@ -31,13 +33,13 @@ FP16_FUNCS = [
     'Deconvolution',
     'FullyConnected',
     'RNN',
-    ]
+    ])
 
 # Functions that should not be casted, either because
 # they are irrelevant (not used in the network itself
 # like image transformations or optimizers) or they
 # are dtype neutral (can work in both fp16 and fp32)
-FP16_FP32_FUNCS = [
+FP16_FP32_FUNCS = frozenset([
     'BatchNorm',
     'BilinearSampler',
     'BlockGrad',
@@ -476,11 +478,11 @@ FP16_FP32_FUNCS = [
     'transpose',
     'trunc',
     'zeros_like',
-    ]
+    ])
 
 # Functions that have to be cast to FP32 due to possible
 # overflows
-FP32_FUNCS = [
+_FP32_FUNCS_BASE = frozenset([
     'IdentityAttachKLSparseReg',
     'arccos',
     'arcsin',
@@ -628,30 +630,31 @@ FP32_FUNCS = [
     '_contrib_sldwin_atten_score',
     '_contrib_sldwin_atten_mask_like',
     '_contrib_sldwin_atten_context',
-    ]
+    ])
 
-if Features().is_enabled('ONEDNN'):
-    FP32_FUNCS.extend([
-        '_sg_onednn_conv',
-        '_sg_onednn_fully_connected',
-        '_sg_onednn_selfatt_qk',
-        '_sg_onednn_selfatt_qk_split',
-        '_sg_onednn_selfatt_valatt',
-        '_sg_onednn_batch_dot',
-        '_sg_onednn_batch_norm',
-        '_sg_pow_mul_scalar'
+_FP32_FUNCS_ONEDNN = frozenset([
+    '_sg_onednn_conv',
+    '_sg_onednn_fully_connected',
+    '_sg_onednn_selfatt_qk',
+    '_sg_onednn_selfatt_qk_split',
+    '_sg_onednn_selfatt_valatt',
+    '_sg_onednn_batch_dot',
+    '_sg_onednn_batch_norm',
+    '_sg_pow_mul_scalar'
     ])
+FP32_FUNCS = (_FP32_FUNCS_BASE | _FP32_FUNCS_ONEDNN if _ONEDNN
+              else _FP32_FUNCS_BASE)
 
 # Functions that have to be cast to FP32 only for
-# some values of their parameters
-CONDITIONAL_FP32_FUNCS = [
-    ('Activation', 'act_type', ['softrelu']),
-    ('LeakyReLU', 'act_type', ['elu', 'selu']),
-    ]
+# some values of their parameters, as {name: (parameter, values)}
+CONDITIONAL_FP32_FUNCS = {
+    'Activation': ('act_type', frozenset(['softrelu'])),
+    'LeakyReLU': ('act_type', frozenset(['elu', 'selu'])),
+    }
 
 # Functions with multiple inputs, that need the same
 # type of all their inputs
-WIDEST_TYPE_CASTS = [
+WIDEST_TYPE_CASTS = frozenset([
     '_equal',
     '_greater',
     '_greater_equal',
@@ -748,7 +751,7 @@ WIDEST_TYPE_CASTS = [
     '_random_pdf_dirichlet',
     '_random_pdf_normal',
     '_random_pdf_poisson',
-    ]
+    ])
 
 LOSS_OUTPUT_FUNCTIONS = [
     'SoftmaxOutput',
@@ -756,3 +759,17 @@ LOSS_OUTPUT_FUNCTIONS = [
     'LogisticRegressionOutput',
     'MAERegressionOutput',
     ]
+
+# Cast policy of every op listed in the tables above
+POLICY_FP16, POLICY_FP32, POLICY_WIDEST, POLICY_FP16_FP32, POLICY_CONDITIONAL_FP32 = range(5)
+
+# Single op name -> cast policy lookup, built once at import
+OP_POLICY = dict.fromkeys(FP16_FUNCS, POLICY_FP16)
+OP_POLICY.update(dict.fromkeys(FP32_FUNCS, POLICY_FP32))
+OP_POLICY.update(dict.fromkeys(WIDEST_TYPE_CASTS, POLICY_WIDEST))
+OP_POLICY.update(dict.fromkeys(FP16_FP32_FUNCS, POLICY_FP16_FP32))
+OP_POLICY.update(dict.fromkeys(CONDITIONAL_FP32_FUNCS, POLICY_CONDITIONAL_FP32))
+if __debug__:
+    _check_disjoint(FP16_FUNCS=FP16_FUNCS, FP16_FP32_FUNCS=FP16_FP32_FUNCS,
+                    FP32_FUNCS=FP32_FUNCS, WIDEST_TYPE_CASTS=WIDEST_TYPE_CASTS,
+                    CONDITIONAL_FP32_FUNCS=CONDITIONAL_FP32_FUNCS)
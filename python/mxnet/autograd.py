@@ -89,6 +89,29 @@ def is_training():
     return curr.value
 
 
+def _set_recording_state(is_record, train_mode): #pylint: disable=redefined-outer-name
+    """Set recording and training status with a single call into the backend.
+
+    Parameters
+    ----------
+    is_record: bool or None
+        New recording status, None to keep the current one.
+    train_mode: bool or None
+        New training status, None to keep the current one.
+
+    Returns
+    -------
+    (previous recording status, previous training status) before this set.
+    """
+    prev_is_record = ctypes.c_int()
+    prev_train_mode = ctypes.c_int()
+    check_call(_LIB.MXAutogradSetRecordingState(
+        ctypes.c_int(-1 if is_record is None else is_record),
+        ctypes.c_int(-1 if train_mode is None else train_mode),
+        ctypes.byref(prev_is_record), ctypes.byref(prev_train_mode)))
+    return bool(prev_is_record.value), bool(prev_train_mode.value)
+
+
 class _RecordingStateScope(object):
     """Scope for managing training state.
 
@@ -106,16 +129,22 @@ class _RecordingStateScope(object):
         self._prev_train_mode = None
 
     def __enter__(self):
+        prev_is_record, prev_train_mode = _set_recording_state(self._enter_is_record,
+                                                               self._enter_train_mode)
         if self._enter_is_record is not None:
-            self._prev_is_record = set_recording(self._enter_is_record)
+            self._prev_is_record = prev_is_record
         if self._enter_train_mode is not None:
-            self._prev_train_mode = set_training(self._enter_train_mode)
+            self._prev_train_mode = prev_train_mode
 
     def __exit__(self, ptype, value, trace):
+        restore_is_record = None
+        restore_train_mode = None
         if self._enter_is_record is not None and self._prev_is_record != self._enter_is_record:
-            set_recording(self._prev_is_record)
+            restore_is_record = self._prev_is_record
         if self._enter_train_mode is not None and self._prev_train_mode != self._enter_train_mode:
-            set_training(self._prev_train_mode)
+            restore_train_mode = self._prev_train_mode
+        if restore_is_record is not None or restore_train_mode is not None:
+            _set_recording_state(restore_is_record, restore_train_mode)
 
 
 def record(train_mode=True): #pylint: disable=redefined-outer-name
@@ -211,14 +240,15 @@ def mark_variables(variables, gradients, grad_reqs='write'):
         gradients = [gradients]
 
     if isinstance(grad_reqs, string_types):
-        grad_reqs = [_GRAD_REQ_MAP[grad_reqs]]*len(variables)
+        # repeat the single translated value at C level instead of building a list
+        grad_reqs = array('I', [_GRAD_REQ_MAP[grad_reqs]]) * len(variables)
     else:
-        grad_reqs = [_GRAD_REQ_MAP[i] for i in grad_reqs]
+        grad_reqs = array('I', [_GRAD_REQ_MAP[i] for i in grad_reqs])
 
     check_call(_LIB.MXAutogradMarkVariables(
         len(variables),
         c_handle_array(variables),
-        c_array_buf(mx_uint, array('I', grad_reqs)),
+        c_array_buf(mx_uint, grad_reqs),
         c_handle_array(gradients)))
 
 
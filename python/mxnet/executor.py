@@ -40,6 +40,11 @@ class Executor:
         self._aux_names = sym.list_auxiliary_states()
         self._arg_names = sym.list_arguments()
         self._output_names = sym.list_outputs()
+        # name -> position lookups; keep the first occurrence like list.index
+        self._input_index = {name: i for i, name in reversed(list(enumerate(self._input_names)))}
+        self._arg_index = {name: i for i, name in reversed(list(enumerate(self._arg_names)))}
+        self._arg_name_set = frozenset(self._arg_names)
+        self._aux_name_set = frozenset(self._aux_names)
         self._device = device
         self._grad_req = grad_req
         self.static_alloc = static_alloc
@@ -47,7 +52,7 @@ class Executor:
         self._requires_grad = False
         if isinstance(grad_req, dict):
             for k, v in grad_req.items():
-                if k in self._input_names and v != 'null':
+                if k in self._input_index and v != 'null':
                     self._requires_grad = True
         else:
             assert isinstance(grad_req, str)
@@ -62,53 +67,48 @@ class Executor:
         self._args = [None] * len(self._input_names)
         if isinstance(args, dict):
             for k, v in args.items():
-                try:
-                    i = self._input_names.index(k)
-                    self._args[i] = v.copyto(device)
+                i = self._input_index.get(k)
                 # ignore provided arg which is not present in
                 # input_names
-                except ValueError:
-                    pass
+                if i is not None:
+                    self._args[i] = v.copyto(device)
         else:
             assert isinstance(args, (list, tuple))
             for i, arg in enumerate(args):
-                name = self._arg_names[i]
-                index = self._input_names.index(name)
+                index = self._input_index[self._arg_names[i]]
                 self._args[index] = arg.copyto(device)
 
         # aux states
         if aux_states:
             if isinstance(aux_states, dict):
                 for k, v in aux_states.items():
-                    if k in self._aux_names:
-                        i = self._input_names.index(k)
-                        self._args[i] = v.copyto(device)
+                    if k in self._aux_name_set:
+                        self._args[self._input_index[k]] = v.copyto(device)
             else:
                 assert isinstance(aux_states, (list, tuple))
                 for i, v in enumerate(aux_states):
-                    index = self._input_names.index(self._aux_names[i])
+                    index = self._input_index[self._aux_names[i]]
                     self._args[index] = v.copyto(device)
 
         # arg grad
         if self._args_grad:
             if isinstance(self._args_grad, dict):
                 for k, g in self._args_grad.items():
-                    try:
-                        i = self._input_names.index(k)
-                        # get req
-                        if isinstance(grad_req, str):
-                            req = grad_req
-                        else:
-                            assert isinstance(grad_req, dict)
-                            req = grad_req[k]
-                        if req != 'null':
-                            with self._device:
-                                self._args[i].attach_grad(req, stype=g.stype)
-                                self._args[i].grad[:] = g
+                    i = self._input_index.get(k)
                     # ignore provided arg which is not present in
                     # input_names
-                    except ValueError:
-                        pass
+                    if i is None:
+                        continue
+                    # get req
+                    if isinstance(grad_req, str):
+                        req = grad_req
+                    else:
+                        assert isinstance(grad_req, dict)
+                        req = grad_req[k]
+                    if req != 'null':
+                        with self._device:
+                            self._args[i].attach_grad(req, stype=g.stype)
+                            self._args[i].grad[:] = g
             else:
                 assert isinstance(self._args_grad, (list, tuple))
                 for i, g in enumerate(self._args_grad):
@@ -123,6 +123,7 @@ class Executor:
                             self._args[i].attach_grad(req, stype=g.stype)
                             self._args[i].grad[:] = g
         self._cached_op = ndarray.CachedOp(sym, flags=[("static_alloc", self.static_alloc)])
+        self._optimized_symbol = None
 
     def get_optimized_symbol(self):
         """Get an optimized version of the symbol from the executor.
@@ -130,9 +131,13 @@ class Executor:
         Returns
         -------
         symbol : Symbol
-            Optimized symbol from the executor.
+            Optimized symbol from the executor. The optimized graph is fixed
+            once the executor is created, so the same symbol is returned on
+            every call.
         """
-        return self._cached_op.get_optimized_symbol()
+        if self._optimized_symbol is None:
+            self._optimized_symbol = self._cached_op.get_optimized_symbol()
+        return self._optimized_symbol
 
 
     def forward(self, is_train=False, **kwargs):
@@ -160,8 +165,8 @@ class Executor:
         """
         if kwargs:
             for name, array in kwargs.items():
-                if name in self._input_names:
-                    index = self._input_names.index(name)
+                index = self._input_index.get(name)
+                if index is not None:
                     with self._device:
                         arr = ndarray.array(array, dtype=array.dtype)
                         if self._args[index] is None:
@@ -215,14 +220,11 @@ class Executor:
 
             if isinstance(self._args_grad, dict):
                 for k, v in self._args_grad.items():
-                    try:
-                        i = self._input_names.index(k)
-                        if self._args[i].grad is not None:
-                            v[:] = self._args[i].grad
+                    i = self._input_index.get(k)
                     # ignore provided arg grad which is not present in
                     # input_names
-                    except ValueError:
-                        pass
+                    if i is not None and self._args[i].grad is not None:
+                        v[:] = self._args[i].grad
             else:
                 assert isinstance(self._args_grad, (list, tuple))
                 for arg, out in zip(self._args, self._args_grad):
@@ -233,21 +235,13 @@ class Executor:
     def aux_arrays(self):
         """the auxilary argument array"""
         assert isinstance(self._args, list)
-        aux_array = []
-        for name in self._aux_names:
-            index = self._input_names.index(name)
-            aux_array.append(self._args[index])
-        return aux_array
+        return [self._args[self._input_index[name]] for name in self._aux_names]
 
     @property
     def arg_arrays(self):
         """the argument array"""
         assert isinstance(self._args, list)
-        arg_array = []
-        for name in self._arg_names:
-            index = self._input_names.index(name)
-            arg_array.append(self._args[index])
-        return arg_array
+        return [self._args[self._input_index[name]] for name in self._arg_names]
 
     @property
     def grad_arrays(self):
@@ -258,15 +252,13 @@ class Executor:
         arr = [None] * len(self._arg_names)
         if self._args_grad:
             assert isinstance(self._args_grad, dict)
-            for k, _ in self._args_grad.items():
-                try:
-                    i = self._input_names.index(k)
-                    j = self._arg_names.index(k)
-                    arr[j] = self._args[i].grad
+            for k in self._args_grad:
+                i = self._input_index.get(k)
+                j = self._arg_index.get(k)
                 # ignore provided arg grad which is not present in
                 # input_names
-                except ValueError:
-                    pass
+                if i is not None and j is not None:
+                    arr[j] = self._args[i].grad
         return arr
 
     @property
@@ -282,11 +274,8 @@ class Executor:
         ------
         ValueError : if there are duplicated names in the arguments.
         """
-        ret = {}
-        for k, v in zip(self._input_names, self._args):
-            if k in self._arg_names:
-                ret[k] = v
-        return ret
+        names = self._arg_name_set
+        return {k: v for k, v in zip(self._input_names, self._args) if k in names}
 
     @property
     def aux_dict(self):
@@ -301,11 +290,8 @@ class Executor:
         ------
         ValueError : if there are duplicated names in the auxiliary states.
         """
-        ret = {}
-        for k, v in zip(self._input_names, self._args):
-            if k in self._aux_names:
-                ret[k] = v
-        return ret
+        names = self._aux_name_set
+        return {k: v for k, v in zip(self._input_names, self._args) if k in names}
 
     @property
     def grad_dict(self):
@@ -316,11 +302,8 @@ class Executor:
         grad_dict : dict of str to NDArray
             The dictionary that maps name of arguments to gradient arrays.
         """
-        ret = {}
-        for k, v in zip(self._input_names, self._args):
-            if k in self._arg_names:
-                ret[k] = v.grad
-        return ret
+        names = self._arg_name_set
+        return {k: v.grad for k, v in zip(self._input_names, self._args) if k in names}
 
     @property
     def output_dict(self):
@@ -335,10 +318,7 @@ class Executor:
         ------
         ValueError : if there are duplicated names in the outputs.
         """
-        ret = {}
-        for k, v in zip(self._output_names, self.outputs):
-            ret[k] = v
-        return ret
+        return dict(zip(self._output_names, self.outputs))
 
     def copy_params_from(self, arg_params, aux_params=None, allow_extra_params=False):
         """Copy parameters from arg_params, aux_params into executor's internal array.
@@ -368,19 +348,22 @@ class Executor:
         >>> sym, arg_params, aux_params = mx.model.load_checkpoint(model_prefix, 0)
         >>> texec.copy_params_from(arg_params, aux_params)
         """
+        arg_dict = self.arg_dict
         for name, array in arg_params.items():
-            if name in self.arg_dict:
-                dst = self.arg_dict[name]
-                array.astype(dst.dtype).copyto(dst)
+            if name in arg_dict:
+                dst = arg_dict[name]
+                # copy=False skips the temporary when the dtypes already match
+                array.astype(dst.dtype, copy=False).copyto(dst)
             elif not allow_extra_params:
                 raise ValueError(f'Find name \"{name}\" that is not in the arguments')
 
         if aux_params is None:
             return
 
+        aux_dict = self.aux_dict
         for name, array in aux_params.items():
-            if name in self.aux_dict:
-                dst = self.aux_dict[name]
-                array.astype(dst.dtype).copyto(dst)
+            if name in aux_dict:
+                dst = aux_dict[name]
+                array.astype(dst.dtype, copy=False).copyto(dst)
             elif not allow_extra_params:
                 raise ValueError(f'Find name {name} that is not in the auxiliary states')
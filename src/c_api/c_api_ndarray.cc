@@ -291,6 +291,23 @@ int MXAutogradSetIsRecording(int is_recording, int* prev) {
   API_END();
 }
 
+int MXAutogradSetRecordingState(int is_recording,
+                                int is_training,
+                                int* prev_recording,
+                                int* prev_training) {
+  API_BEGIN();
+  Imperative* imperative = Imperative::Get();
+  *prev_recording        = imperative->is_recording();
+  *prev_training         = imperative->is_training();
+  if (is_recording >= 0) {
+    imperative->set_is_recording(static_cast<bool>(is_recording));
+  }
+  if (is_training >= 0) {
+    imperative->set_is_training(static_cast<bool>(is_training));
+  }
+  API_END();
+}
+
 int MXSetOptimizationConstraints(unsigned int constraints, unsigned int* prev) {
   API_BEGIN();
   *prev =
@@ -162,6 +162,9 @@ using NodeEntrySet_t = std::unordered_set<NodeEntry, nnvm::NodeEntryHash, nnvm::
 using NodesEntries_t = std::unordered_map<Node*, NodeEntrySet_t>;
 using DstNodes_t     = std::unordered_map<Node*, std::unordered_map<Node*, NodeEntry>>;
 
+/*! \brief How a node is converted, depending on which op list its operator is in */
+enum class AMPPolicy { kFP32, kTargetDtype, kWidestDtype, kDTypeNeutral };
+
 /*! \brief Makes sure the node in the new graph will work with the same precision as in the original
  * graph */
 static void KeepOriginalNode(const ObjectPtr& old_node,
@@ -396,6 +399,26 @@ Graph ReducePrecision(Graph&& src) {
     register_node_entry(old_out_ne, nullptr, nullptr);
   }
 
+  // every node is visited twice and operators repeat across the graph, so resolve the op lists
+  // once per operator instead of hashing the op name for each visit
+  std::unordered_map<const nnvm::Op*, AMPPolicy> op_policies;
+  const auto get_op_policy = [&](const nnvm::Op* const op) {
+    const auto it = op_policies.find(op);
+    if (it != op_policies.end()) {
+      return it->second;
+    }
+    AMPPolicy policy = AMPPolicy::kDTypeNeutral;
+    if (fp32_ops.count(op->name) > 0) {
+      policy = AMPPolicy::kFP32;
+    } else if (target_dtype_ops.count(op->name) > 0) {
+      policy = AMPPolicy::kTargetDtype;
+    } else if (widest_dtype_ops.count(op->name) > 0) {
+      policy = AMPPolicy::kWidestDtype;
+    }
+    op_policies.emplace(op, policy);
+    return policy;
+  };
+
   // convert the model
   const auto convert_node_fn = [&](const ObjectPtr& old_node) {
     if (old_node->is_variable() || old_node->op() == Op::Get("amp_multicast") ||
@@ -409,16 +432,17 @@ Graph ReducePrecision(Graph&& src) {
     }
     auto opt_constraints =
         common::flag_attr_accumulate<OptConstraint_int_t>(old_node->attrs, OPT_CONSTRAINT_ATTR);
-    if (fp32_ops.count(old_node->op()->name) > 0 ||
+    const AMPPolicy policy = get_op_policy(old_node->op());
+    if (policy == AMPPolicy::kFP32 ||
         (opt_constraints & static_cast<OptConstraint_int_t>(OptConstraint::DisableAMP))) {
       KeepOriginalNode(old_node, node_map, &entry_map);
-    } else if (target_dtype_ops.count(old_node->op()->name) > 0) {
+    } else if (policy == AMPPolicy::kTargetDtype) {
       if (!TryLowPrecision(target_dtype, old_node, node_map, nodes_entries, &entry_map)) {
         LOG(WARNING) << "Low precision conversion failure. Node '" + old_node->attrs.name +
                             "' will not be converted.";
         KeepOriginalNode(old_node, node_map, &entry_map);
       }
-    } else if (widest_dtype_ops.count(old_node->op()->name) > 0) {
+    } else if (policy == AMPPolicy::kWidestDtype) {
       HandleWidestDtypeNode(target_dtype, old_node, node_map, nodes_entries, &entry_map);
     } else {
       HandleDTypeNeutralNode(target_dtype, old_node, node_map, nodes_entries, &entry_map);
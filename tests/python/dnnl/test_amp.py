@@ -30,8 +30,8 @@ from mxnet.amp.lists.symbol_bf16 import (BF16_FUNCS, BF16_FP32_FUNCS, WIDEST_TYP
 from op_cfg import get_op_cfg_generator, get_symblock_from_args_scenario, CFG_RTOL_ATOL
 
 
-ALL_BF16_OPS = BF16_FUNCS + BF16_FP32_FUNCS + WIDEST_TYPE_CASTS
-ALL_BF16_OPS += [op_name for op_name, attr_name, attr_vals in CONDITIONAL_FP32_FUNCS]
+ALL_BF16_OPS = sorted(BF16_FUNCS | BF16_FP32_FUNCS | WIDEST_TYPE_CASTS)
+ALL_BF16_OPS += sorted(CONDITIONAL_FP32_FUNCS)
 
 AMP_DTYPE = 'bfloat16'
 
@@ -336,6 +336,26 @@ def test_is_train():
         y = mx.nd.Dropout(x, p=0.5)
         assert y.asnumpy().max() == 2 and y.asnumpy().min() == 0
 
+def test_recording_state_scope_restore():
+    with record():
+        with pause():
+            assert not is_recording()
+            assert not is_training()
+            with predict_mode():
+                assert not is_recording()
+                assert not is_training()
+        assert is_recording()
+        assert is_training()
+        with pytest.raises(ValueError):
+            with pause(train_mode=True):
+                assert not is_recording()
+                assert is_training()
+                raise ValueError()
+        assert is_recording()
+        assert is_training()
+    assert not is_recording()
+    assert not is_training()
+
 @pytest.mark.garbage_expected
 def test_function():
     class func(Function):